@@ -1,18 +1,117 @@
+import io
+import struct
 import tempfile
 from pathlib import Path
+from typing import IO
 
 import numpy as np
 from numpy.typing import NDArray
-from scipy.io import wavfile
 
 from shh.utils.exceptions import AudioProcessingError
 
 SAMPLE_RATE = 16000  # Hz
 CHANNELS = 1  # mono audio
 
+INT16_SCALE = np.float32(32767.0)
+
+
+def _convert_to_int16(audio_data: NDArray[np.float32] | NDArray[np.int16]) -> NDArray[np.int16]:
+    """
+    Convert float32 audio in [-1.0, 1.0] to int16 PCM in a single buffer.
+
+    int16 input (the recorder's native dtype) is passed through untouched.
+    For float32, scale, clip, and round are all done in-place on one
+    temporary instead of allocating a fresh array per step, so the
+    conversion stays one pass over memory. Out-of-range samples are clipped
+    instead of wrapping around on the int16 cast.
+
+    Args:
+        audio_data (NDArray[np.float32] | NDArray[np.int16]): The audio data to convert.
+    Returns:
+        NDArray[np.int16]: The converted PCM samples.
+    """
+    if audio_data.dtype == np.int16:
+        return audio_data.astype(np.int16, copy=False)
+
+    scaled = np.multiply(audio_data, INT16_SCALE)
+    np.clip(scaled, np.float32(np.iinfo(np.int16).min), INT16_SCALE, out=scaled)
+    np.rint(scaled, out=scaled)
+    return scaled.astype(np.int16)
+
+
+def _write_wav_header(
+    f: IO[bytes],
+    n_samples: int,
+    sample_rate: int,
+    channels: int = CHANNELS,
+    bits_per_sample: int = 16,
+) -> None:
+    """
+    Write the canonical 44-byte RIFF/WAVE header for PCM audio.
+
+    Args:
+        f (IO[bytes]): Binary file object positioned at the start of the file.
+        n_samples (int): Number of samples per channel.
+        sample_rate (int): The sample rate of the audio data.
+        channels (int): Number of audio channels.
+        bits_per_sample (int): Bits per PCM sample.
+    """
+    block_align = channels * bits_per_sample // 8
+    byte_rate = sample_rate * block_align
+    data_size = n_samples * block_align
+
+    f.write(struct.pack("<4sI4s", b"RIFF", 36 + data_size, b"WAVE"))
+    f.write(
+        struct.pack(
+            "<4sIHHIIHH",
+            b"fmt ",
+            16,  # PCM fmt chunk size
+            1,  # PCM format tag
+            channels,
+            sample_rate,
+            byte_rate,
+            block_align,
+            bits_per_sample,
+        )
+    )
+    f.write(struct.pack("<4sI", b"data", data_size))
+
+
+def save_audio_to_wav_bytes(
+    audio_data: NDArray[np.float32] | NDArray[np.int16],
+    sample_rate: int = SAMPLE_RATE,
+) -> bytes:
+    """
+    Encode audio data as an in-memory WAV payload.
+
+    The recorded samples never need to touch disk: the Whisper client
+    accepts a bytes upload, so this skips the temp-file create/reopen/unlink
+    round trip of save_audio_to_wav.
+
+    Args:
+        audio_data (NDArray[np.float32] | NDArray[np.int16]): The audio data to encode.
+            float32 samples are converted; int16 samples are written as-is.
+        sample_rate (int): The sample rate of the audio data.
+    Returns:
+        bytes: A complete RIFF/WAVE payload.
+    Raises:
+        AudioProcessingError: If there is an error encoding the audio.
+    """
+    try:
+        audio_int16 = _convert_to_int16(audio_data)
+
+        buffer = io.BytesIO()
+        _write_wav_header(buffer, len(audio_int16), sample_rate)
+        # .data is a memoryview over the array buffer - no tobytes() copy
+        buffer.write(audio_int16.data)
+        return buffer.getvalue()
+
+    except Exception as e:
+        raise AudioProcessingError(f"Failed to encode audio as WAV: {e}") from e
+
 
 def save_audio_to_wav(
-    audio_data: NDArray[np.float32],
+    audio_data: NDArray[np.float32] | NDArray[np.int16],
     sample_rate: int = SAMPLE_RATE,
 ) -> Path:
     """
@@ -20,7 +119,8 @@ def save_audio_to_wav(
     This function is not responsible for cleaning up the temporary file.
 
     Args:
-        audio_data (NDArray[np.float32]): The audio data to save.
+        audio_data (NDArray[np.float32] | NDArray[np.int16]): The audio data to save.
+            float32 samples are converted; int16 samples are written as-is.
         sample_rate (int): The sample rate of the audio data.
     Returns:
         Path: The path to the saved WAV file.
@@ -28,15 +128,17 @@ def save_audio_to_wav(
         AudioProcessingError: If there is an error saving the audio file.
     """
     try:
-        # Convert float32 audio data to int16
-        audio_int16: NDArray[np.int16] = (audio_data * 32767).astype(np.int16)
+        audio_int16 = _convert_to_int16(audio_data)
 
-        # Create a temporary file
+        # Write header + samples straight into the tempfile (no close/reopen)
         with tempfile.NamedTemporaryFile(delete=False, suffix=".wav") as temp_file:
             temp_file_path = Path(temp_file.name)
-
-        # Write the audio data to the WAV file
-        wavfile.write(temp_file_path, sample_rate, audio_int16)
+            _write_wav_header(temp_file, len(audio_int16), sample_rate)
+            # tofile streams straight from the array buffer; tobytes() would
+            # allocate a full-size intermediate bytes object first. Flush so
+            # the buffered header lands before the raw fd write.
+            temp_file.flush()
+            audio_int16.tofile(temp_file.file)
 
         return temp_file_path
 
@@ -28,7 +28,8 @@ class AudioRecorder:
         """
         self._sample_rate = sample_rate
         self._max_duration = max_duration or self.MAX_RECORDING_DURATION
-        self._chunks: list[NDArray[np.float32]] = []
+        self._buffer: NDArray[np.int16] | None = None
+        self._offset = 0
         self._stream: sd.InputStream | None = None
         self._start_time: float | None = None
 
@@ -39,8 +40,18 @@ class AudioRecorder:
             Self for use within the async context manager.
         """
 
+        # One buffer for the whole recording: the callback fills it at a
+        # running offset, so finalization never has to concatenate chunks.
+        # int16 is the WAV target format anyway, so storing it directly
+        # halves the buffer and skips the float->int conversion pass.
+        buffer: NDArray[np.int16] = np.empty(
+            int(self._max_duration * self._sample_rate), dtype=np.int16
+        )
+        self._buffer = buffer
+        self._offset = 0
+
         def callback(
-            indata: NDArray[np.float32], frames: int, time_info: object, status: sd.CallbackFlags
+            indata: NDArray[np.int16], frames: int, time_info: object, status: sd.CallbackFlags
         ) -> None:
             """
             Called by sounddevice for each audio block every 100ms.
@@ -53,13 +64,17 @@ class AudioRecorder:
             if status:
                 logger.warning(f"Audio recording status: {status}")
 
-            self._chunks.append(indata.copy())
+            end = min(self._offset + frames, len(buffer))
+            n = end - self._offset
+            if n > 0:
+                np.copyto(buffer[self._offset : end], indata[:n, 0])
+                self._offset = end
 
         try:
             self._stream = sd.InputStream(
                 samplerate=self._sample_rate,
                 channels=1,
-                dtype=np.float32,
+                dtype=np.int16,
                 callback=callback,
             )
             await asyncio.to_thread(self._stream.start)
@@ -85,17 +100,16 @@ class AudioRecorder:
             except Exception as e:
                 logger.error(f"Error stopping audio stream: {e}")
 
-    def get_audio(self) -> NDArray[np.float32]:
+    def get_audio(self) -> NDArray[np.int16]:
         """
         Retrieve the recorded audio data as a single NumPy array.
         Returns:
-            A NumPy array containing the recorded audio data.
+            A zero-copy view of the recorded samples.
         """
-        if not self._chunks:
-            return np.array([], dtype=np.float32)
+        if self._buffer is None or self._offset == 0:
+            return np.array([], dtype=np.int16)
 
-        audio = np.concatenate(self._chunks, axis=0)
-        return audio.flatten()
+        return self._buffer[: self._offset]
 
     def elapsed_time(self) -> float:
         """
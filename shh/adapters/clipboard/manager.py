@@ -1,10 +1,45 @@
 """Clipboard operations for copying transcription results."""
 
-import contextlib
+import functools
+from collections.abc import Callable
+from typing import cast
 
 import pyperclip  # type: ignore[import-untyped]
 
 
+@functools.cache
+def _copy_backend() -> Callable[[str], None]:
+    """
+    Resolve the platform clipboard backend once per process.
+
+    pyperclip's module-level ``copy`` goes through a lazy stub that probes
+    the environment before dispatching; caching the resolved backend skips
+    that indirection on every copy after the first.
+
+    Returns:
+        The platform-native copy function.
+    """
+    copy_fn, _paste_fn = pyperclip.determine_clipboard()
+    return cast(Callable[[str], None], copy_fn)
+
+
+def copy_text(text: str) -> bool:
+    """
+    Copy text to the system clipboard.
+
+    Args:
+        text: Text to copy to clipboard
+
+    Returns:
+        True if the copy succeeded, False if the clipboard is unavailable.
+    """
+    try:
+        _copy_backend()(text)
+        return True
+    except Exception:
+        return False
+
+
 async def copy_to_clipboard(text: str) -> None:
     """
     Copy text to system clipboard.
@@ -15,6 +50,5 @@ async def copy_to_clipboard(text: str) -> None:
     Returns:
         None
     """
-    # Fail silently if clipboard unavailable
-    with contextlib.suppress(Exception):
-        pyperclip.copy(text)
+    # Fails silently if clipboard unavailable
+    copy_text(text)
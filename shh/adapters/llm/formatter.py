@@ -1,3 +1,5 @@
+import functools
+
 from pydantic import BaseModel, Field
 from pydantic_ai import Agent
 from pydantic_ai.models.openai import OpenAIChatModel
@@ -14,11 +16,12 @@ class FormattedTranscription(BaseModel):
     text: str = Field(..., description="The formatted transcription text.")
 
 
-# System prompts for each formatting style
-STYLE_PROMPTS = {
-    TranscriptionStyle.CASUAL: """
-You are a helpful assistant that formats voice transcriptions in a casual, conversational style.
-
+# System prompts per formatting style. The literals are pre-stripped so no
+# string processing runs at import time.
+_CASUAL_PROMPT = (
+    "You are a helpful assistant that formats voice transcriptions"
+    " in a casual, conversational style.\n"
+    """
 Your task:
 - Automatically detect the language of the input text
 - Preserve the original language UNLESS a target language is specified
@@ -33,11 +36,13 @@ If a target language is specified:
 - Ensure the translation sounds natural in the target language
 
 Do NOT add information that wasn't in the original transcription.
-Just clean it up and make it flow naturally.
-""".strip(),
-    TranscriptionStyle.BUSINESS: """
-You are a professional editor that formats voice transcriptions for business communication.
+Just clean it up and make it flow naturally."""
+)
 
+_BUSINESS_PROMPT = (
+    "You are a professional editor that formats voice transcriptions"
+    " for business communication.\n"
+    """
 Your task:
 - Automatically detect the language of the input text
 - Preserve the original language UNLESS a target language is specified
@@ -53,9 +58,32 @@ If a target language is specified:
 - Use professional terminology appropriate for the target language
 
 Do NOT add information that wasn't in the original transcription.
-Focus on clarity and professionalism.
-""".strip(),
-}
+Focus on clarity and professionalism."""
+)
+
+
+def _style_prompt(style: TranscriptionStyle) -> str:
+    """Return the system prompt for a style (CASUAL doubles as the fallback,
+    e.g. for neutral-with-translation)."""
+    if style is TranscriptionStyle.BUSINESS:
+        return _BUSINESS_PROMPT
+    return _CASUAL_PROMPT
+
+
+@functools.lru_cache(maxsize=8)
+def _get_agent(style: TranscriptionStyle, api_key: str) -> Agent[None, FormattedTranscription]:
+    """Build (or reuse) the formatting agent for a (style, api_key) pair.
+
+    Agent construction runs pydantic schema inspection for the structured
+    output type plus provider/model setup - identical work on every call,
+    so it is cached per key like the Whisper client.
+    """
+    model = OpenAIChatModel("gpt-4o-mini", provider=OpenAIProvider(api_key=api_key))
+    return Agent(
+        model,
+        output_type=FormattedTranscription,
+        system_prompt=_style_prompt(style),
+    )
 
 
 async def format_transcription(
@@ -77,27 +105,20 @@ async def format_transcription(
         FormattedTranscription with styled and optionally translated text
     """
 
+    # Nothing to format (e.g. a silent recording) - skip the LLM round trip
+    if not text.strip():
+        return FormattedTranscription(text=text)
+
     # Handle neutral style - no LLM call needed
     if style == TranscriptionStyle.NEUTRAL and not target_language:
         return FormattedTranscription(text=text)
 
-    # For neutral style with translation, use casual prompt
-    system_prompt = STYLE_PROMPTS.get(style, STYLE_PROMPTS[TranscriptionStyle.CASUAL])
-
     # Build the user prompt
     user_prompt = f"Format this transcription: {text}"
     if target_language:
         user_prompt = f"Format this transcription and translate it to {target_language}: {text}"
 
-    # Create OpenAI model with API key
-    model = OpenAIChatModel("gpt-4o-mini", provider=OpenAIProvider(api_key=api_key))
-
-    # Create PydanticAI agent
-    agent: Agent[None, FormattedTranscription] = Agent(
-        model,
-        output_type=FormattedTranscription,
-        system_prompt=system_prompt,
-    )
+    agent = _get_agent(style, api_key)
 
     try:
         result = await agent.run(user_prompt)
@@ -1,5 +1,6 @@
 """OpenAI Whisper API client adapter."""
 
+import functools
 from pathlib import Path
 
 from openai import AsyncOpenAI
@@ -10,21 +11,39 @@ from shh.utils.exceptions import TranscriptionError
 from shh.utils.logger import logger
 
 
+@functools.lru_cache(maxsize=4)
+def _get_client(api_key: str) -> AsyncOpenAI:
+    """Reuse one client per API key so successive transcriptions share the
+    underlying httpx connection pool instead of re-doing TCP+TLS setup."""
+    return AsyncOpenAI(api_key=api_key)
+
+
 async def transcribe_audio(
-    audio_file_path: Path,
+    audio: Path | bytes,
     api_key: str,
     model: str = "whisper-1",
 ) -> WhisperTranscription:
-    """Transcribe audio with OpenAI Whisper, returning text + detected language."""
-    client = AsyncOpenAI(api_key=api_key)
+    """Transcribe audio with OpenAI Whisper, returning text + detected language.
+
+    Accepts either a path to a WAV file or the WAV payload itself; in-memory
+    bytes go straight into the multipart upload without touching disk.
+    """
+    client = _get_client(api_key)
     try:
-        with audio_file_path.open("rb") as audio_file:
-            response: TranscriptionVerbose = await client.audio.transcriptions.create(
-                file=audio_file,
+        if isinstance(audio, Path):
+            with audio.open("rb") as audio_file:
+                response: TranscriptionVerbose = await client.audio.transcriptions.create(
+                    file=audio_file,
+                    model=model,
+                    response_format="verbose_json",
+                )
+        else:
+            response = await client.audio.transcriptions.create(
+                file=("audio.wav", audio, "audio/wav"),
                 model=model,
                 response_format="verbose_json",
             )
-            return WhisperTranscription(text=response.text, detected_lang=response.language)
+        return WhisperTranscription(text=response.text, detected_lang=response.language)
     except Exception as e:
         logger.error(f"Transcription failed: {e}")
         raise TranscriptionError("Failed to transcribe audio.") from e
@@ -7,10 +7,12 @@ import typer
 
 from shh.cli.commands.config import config_app
 from shh.cli.commands.history import history_app
-from shh.cli.commands.record import record_command
-from shh.cli.commands.setup import setup_command
 from shh.core.styles import TranscriptionStyle
 
+# The record/setup commands import the heavy adapter stack (sounddevice,
+# numpy, openai, pydantic_ai); they are imported inside the command bodies
+# so `shh --help` doesn't pay for them.
+
 app = typer.Typer(
     name="shh",
     help="Voice transcription CLI powered by OpenAI Whisper",
@@ -26,6 +28,8 @@ app.add_typer(history_app, name="history")
 @app.command(name="setup")
 def setup() -> None:
     """Configure OpenAI API key and settings."""
+    from shh.cli.commands.setup import setup_command
+
     setup_command()
 
 
@@ -77,6 +81,8 @@ def default_command(
     if ctx.invoked_subcommand is not None:
         return
 
+    from shh.cli.commands.record import record_command
+
     # Run the async record command
     asyncio.run(
         record_command(
@@ -2,6 +2,7 @@
 
 import os
 import subprocess
+from collections.abc import Callable
 
 import typer
 from rich.console import Console
@@ -16,15 +17,55 @@ console = Console()
 config_app = typer.Typer(help="Manage configuration (wizard, show, get, set, edit, reset)")
 
 
-# Valid settings keys for validation
-VALID_KEYS = {
-    "default_style": list(TranscriptionStyle),
-    "default_translation_language": None,  # Freeform text, no validation
-    "show_progress": [True, False],
-    "quiet_mode": [True, False],
-    "whisper_model": list(WhisperModel),
-    "history_enabled": [True, False],
-    "history_retention": None,  # int, validated by Pydantic ge=1 le=10_000
+def _parse_style(value: str) -> TranscriptionStyle:
+    try:
+        return TranscriptionStyle(value)
+    except ValueError:
+        valid_styles = ", ".join(s.value for s in TranscriptionStyle)
+        raise ValueError(f"Invalid style '{value}'. Valid styles: {valid_styles}") from None
+
+
+def _parse_whisper_model(value: str) -> WhisperModel:
+    try:
+        return WhisperModel(value)
+    except ValueError:
+        valid_models = ", ".join(m.value for m in WhisperModel)
+        raise ValueError(f"Invalid model '{value}'. Valid models: {valid_models}") from None
+
+
+def _parse_optional_text(value: str) -> str | None:
+    # Support clearing the value with special strings
+    return None if value.lower() in ("none", "null", "") else value
+
+
+def _parse_bool(value: str) -> bool:
+    if value.lower() not in ("true", "false"):
+        raise ValueError("Value must be 'true' or 'false'")
+    return value.lower() == "true"
+
+
+def _parse_retention(value: str) -> int:
+    try:
+        int_value = int(value)
+    except ValueError:
+        raise ValueError("history_retention must be an integer") from None
+    if not (1 <= int_value <= 10_000):
+        raise ValueError("history_retention must be between 1 and 10000")
+    return int_value
+
+
+# Per-key value converters. Each raises ValueError with a user-facing message
+# on invalid input; dispatching through this table keeps config_set flat and
+# makes adding a key a one-line change.
+CONVERTERS: dict[str, Callable[[str], TranscriptionStyle | WhisperModel | bool | str | int | None]]
+CONVERTERS = {
+    "default_style": _parse_style,
+    "default_translation_language": _parse_optional_text,
+    "show_progress": _parse_bool,
+    "quiet_mode": _parse_bool,
+    "whisper_model": _parse_whisper_model,
+    "history_enabled": _parse_bool,
+    "history_retention": _parse_retention,
 }
 
 
@@ -92,7 +133,7 @@ def config_get(key: str) -> None:
         console.print(f"{key}: {value}")
     except AttributeError as e:
         console.print(f"[red]Error: Unknown setting '{key}'[/red]")
-        console.print(f"[dim]Valid keys: {', '.join(VALID_KEYS.keys())}, openai_api_key[/dim]")
+        console.print(f"[dim]Valid keys: {', '.join(CONVERTERS)}, openai_api_key[/dim]")
         raise typer.Exit(code=1) from e
 
 
@@ -104,70 +145,28 @@ def config_set(key: str, value: str) -> None:
         key: The setting key to update
         value: The new value
     """
-    settings = Settings.load_from_file() or Settings()
+    settings = Settings.load_or_default()
 
     # Validate key
     if key == "openai_api_key":
         console.print("[yellow]Use 'shh setup' to update API key.[/yellow]")
         raise typer.Exit(code=1)
 
-    if key not in VALID_KEYS:
+    converter = CONVERTERS.get(key)
+    if converter is None:
         console.print(f"[red]Error: Unknown setting '{key}'[/red]")
-        console.print(f"[dim]Valid keys: {', '.join(VALID_KEYS.keys())}[/dim]")
+        console.print(f"[dim]Valid keys: {', '.join(CONVERTERS)}[/dim]")
         raise typer.Exit(code=1)
 
     # Validate and convert value
-    typed_value: TranscriptionStyle | WhisperModel | bool | str | int | None
-
-    if key == "default_style":
-        try:
-            typed_value = TranscriptionStyle(value)
-        except ValueError as e:
-            console.print(f"[red]Error: Invalid style '{value}'[/red]")
-            valid_styles = [s.value for s in TranscriptionStyle]
-            console.print(f"[dim]Valid styles: {', '.join(valid_styles)}[/dim]")
-            raise typer.Exit(code=1) from e
-    elif key == "default_translation_language":
-        # Support clearing the value with special strings
-        typed_value = None if value.lower() in ("none", "null", "") else value
-    elif key == "show_progress":
-        if value.lower() not in ("true", "false"):
-            console.print("[red]Error: show_progress must be 'true' or 'false'[/red]")
-            raise typer.Exit(code=1)
-        typed_value = value.lower() == "true"
-    elif key == "quiet_mode":
-        if value.lower() not in ("true", "false"):
-            console.print("[red]Error: quiet_mode must be 'true' or 'false'[/red]")
-            raise typer.Exit(code=1)
-        typed_value = value.lower() == "true"
-    elif key == "whisper_model":
-        try:
-            typed_value = WhisperModel(value)
-        except ValueError as e:
-            console.print(f"[red]Error: Invalid model '{value}'[/red]")
-            valid_models = [m.value for m in WhisperModel]
-            console.print(f"[dim]Valid models: {', '.join(valid_models)}[/dim]")
-            raise typer.Exit(code=1) from e
-    elif key == "history_enabled":
-        if value.lower() not in ("true", "false"):
-            console.print("[red]Error: history_enabled must be 'true' or 'false'[/red]")
-            raise typer.Exit(code=1)
-        typed_value = value.lower() == "true"
-    elif key == "history_retention":
-        try:
-            int_value = int(value)
-        except ValueError as e:
-            console.print("[red]Error: history_retention must be an integer[/red]")
-            raise typer.Exit(code=1) from e
-        if not (1 <= int_value <= 10_000):
-            console.print("[red]Error: history_retention must be between 1 and 10000[/red]")
-            raise typer.Exit(code=1)
-        typed_value = int_value
-    else:
-        typed_value = value
+    try:
+        typed_value = converter(value)
+    except ValueError as e:
+        console.print(f"[red]Error: {e}[/red]")
+        raise typer.Exit(code=1) from e
 
-    # Update setting
-    setattr(settings, key, typed_value)
+    # Update setting (frozen model - derive a copy)
+    settings = settings.model_copy(update={key: typed_value})
     settings.save_to_file()
 
     console.print(f"[green]✓ Updated {key} = {typed_value}[/green]")
@@ -195,9 +194,8 @@ def config_reset() -> None:
     # Save the API key
     api_key = settings.openai_api_key
 
-    # Create new defaults
-    settings = Settings()
-    settings.openai_api_key = api_key
+    # Create new defaults, keeping the API key
+    settings = Settings(openai_api_key=api_key)
 
     # Save
     settings.save_to_file()
@@ -240,19 +238,18 @@ def config_wizard() -> None:
     """Interactive configuration wizard."""
     console.print("\n[bold cyan]Configuration Wizard[/bold cyan]\n")
 
-    # Load or create settings
-    settings = Settings.load_from_file() or Settings()
+    # Load or create settings; answers accumulate into one frozen-model copy
+    settings = Settings.load_or_default()
+    updates: dict[str, object] = {}
 
     # API Key (mask if exists)
     if settings.openai_api_key:
         console.print(f"[dim]Current API key: sk-***{settings.openai_api_key[-4:]}[/dim]")
         change_key = typer.confirm("Change API key?", default=False)
         if change_key:
-            api_key = typer.prompt("OpenAI API key", hide_input=True)
-            settings.openai_api_key = api_key
+            updates["openai_api_key"] = typer.prompt("OpenAI API key", hide_input=True)
     else:
-        api_key = typer.prompt("OpenAI API key", hide_input=True)
-        settings.openai_api_key = api_key
+        updates["openai_api_key"] = typer.prompt("OpenAI API key", hide_input=True)
 
     # Default style
     console.print("\n[cyan]Formatting Style[/cyan]")
@@ -265,7 +262,7 @@ def config_wizard() -> None:
         show_default=True,
     )
     try:
-        settings.default_style = TranscriptionStyle(style_input)
+        updates["default_style"] = TranscriptionStyle(style_input)
     except ValueError:
         console.print("[yellow]Invalid style, keeping current value[/yellow]")
 
@@ -278,19 +275,19 @@ def config_wizard() -> None:
         default=current_lang,
         show_default=False,
     )
-    if lang_input.lower() in ("none", "null", ""):
-        settings.default_translation_language = None
-    else:
-        settings.default_translation_language = lang_input
+    updates["default_translation_language"] = (
+        None if lang_input.lower() in ("none", "null", "") else lang_input
+    )
 
     # Show progress
     console.print("\n[cyan]Display Options[/cyan]")
-    settings.show_progress = typer.confirm(
+    updates["show_progress"] = typer.confirm(
         "Show recording progress?",
         default=settings.show_progress,
     )
 
     # Save
+    settings = settings.model_copy(update=updates)
     settings.save_to_file()
     console.print("\n[green]✓ Configuration saved[/green]")
     console.print(f"[dim]Location: {Settings.get_config_path()}[/dim]\n")
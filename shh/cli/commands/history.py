@@ -2,12 +2,11 @@
 
 from datetime import UTC, datetime
 
-import pyperclip  # type: ignore[import-untyped]
 import typer
 from rich.console import Console
 
+from shh.adapters.clipboard.manager import copy_text
 from shh.adapters.history.store import HistoryStore
-from shh.cli.ui.history_picker import build_picker_app
 from shh.config.settings import Settings
 from shh.core.models import HistoryEntry
 
@@ -16,7 +15,7 @@ _console = Console()
 
 
 def _store() -> HistoryStore:
-    settings = Settings.load_from_file() or Settings()
+    settings = Settings.load_or_default()
     return HistoryStore(
         path=Settings.get_history_path(),
         retention=settings.history_retention,
@@ -28,7 +27,7 @@ def _now() -> datetime:
 
 
 def _copy_text(entry: HistoryEntry) -> None:
-    pyperclip.copy(entry.text)
+    copy_text(entry.text)
 
 
 @history_app.callback(invoke_without_command=True)
@@ -36,6 +35,9 @@ def history_default(ctx: typer.Context) -> None:
     """Open the interactive picker. Enter copies the selected entry."""
     if ctx.invoked_subcommand is not None:
         return
+    # Deferred: prompt_toolkit is only needed once the picker actually opens
+    from shh.cli.ui.history_picker import build_picker_app
+
     store = _store()
     entries = store.read_all()
     if not entries:
@@ -3,13 +3,10 @@
 import logging
 import sys
 
-from shh.adapters.history.store import HistoryStore
 from shh.cli.ui import PipeUI, QuietUI, RichUI, UIOutput
 from shh.cli.ui.base import RecordingProgress, TranscriptionResult
 from shh.config.settings import Settings
-from shh.core.models import RecordingOptions
 from shh.core.styles import TranscriptionStyle
-from shh.services.recording import RecordingService
 
 # Suppress HTTP request logs
 logging.getLogger("httpx").setLevel(logging.WARNING)
@@ -47,6 +44,11 @@ async def record_command(
         verbose: Force rich UI (overrides config)
         no_history: Skip persisting this transcription to history
     """
+    # Deferred: pulls in sounddevice/numpy/openai/pydantic_ai
+    from shh.adapters.history.store import HistoryStore
+    from shh.core.models import RecordingOptions
+    from shh.services.recording import RecordingService
+
     # Load settings
     settings = Settings.load_from_file()
     if not settings or not settings.openai_api_key:
@@ -80,8 +82,13 @@ async def record_command(
         # Recording phase
         ui.show_recording_start()
 
+        # One reusable progress object - the callback fires several times a second
+        progress = RecordingProgress(elapsed=0.0, max_duration=0.0)
+
         def progress_callback(elapsed: float, max_duration: float) -> None:
-            ui.show_recording_progress(RecordingProgress(elapsed, max_duration))
+            progress.elapsed = elapsed
+            progress.max_duration = max_duration
+            ui.show_recording_progress(progress)
 
         # Always pass progress callback - UI decides how to display it
         audio_data = await service.record_audio(on_progress=progress_callback)
@@ -3,6 +3,7 @@
 import typer
 from rich.console import Console
 from rich.panel import Panel
+from rich.text import Text
 
 from shh.config.settings import Settings
 
@@ -29,31 +30,26 @@ def setup_command() -> None:
         console.print("[red]Error: API key cannot be empty[/red]")
         raise typer.Exit(code=1)
 
-    # Load existing settings or create new ones
-    settings = Settings.load_from_file() or Settings()
-
-    # Update the API key
-    settings.openai_api_key = api_key.strip()
+    # Load existing settings or create new ones; Settings is frozen, so
+    # derive an updated copy instead of mutating
+    settings = Settings.load_or_default().model_copy(update={"openai_api_key": api_key.strip()})
 
     # Save to file
     settings.save_to_file()
     config_path = Settings.get_config_path()
 
-    # Success message with details
-    success_panel = Panel(
-        f"""[green]Configuration saved successfully![/green]
-
-[bold]Config file:[/bold] {config_path}
-
-[bold]Settings:[/bold]
-  • OpenAI API Key: sk-***{api_key[-4:]}
-  • Default style: {settings.default_style}
-  • Show progress: {settings.show_progress}
-  • Whisper model: {settings.whisper_model}
-
-[dim]You can now run 'shh' to start recording![/dim]""",
-        title="Setup Complete",
-        border_style="green",
+    # Success message with details (pre-styled Text - no markup parsing pass)
+    body = Text.assemble(
+        ("Configuration saved successfully!\n\n", "green"),
+        ("Config file:", "bold"),
+        f" {config_path}\n\n",
+        ("Settings:", "bold"),
+        f"\n  • OpenAI API Key: sk-***{api_key[-4:]}\n"
+        f"  • Default style: {settings.default_style}\n"
+        f"  • Show progress: {settings.show_progress}\n"
+        f"  • Whisper model: {settings.whisper_model}\n\n",
+        ("You can now run 'shh' to start recording!", "dim"),
     )
+    success_panel = Panel(body, title="Setup Complete", border_style="green")
 
     console.print(success_panel)
@@ -3,12 +3,18 @@
 from rich.console import Console
 from rich.live import Live
 from rich.spinner import Spinner
+from rich.style import Style
 from rich.text import Text
 
 from shh.cli.ui.base import RecordingProgress, TranscriptionResult, UIOutput
 
 _DEFAULT_CONSOLE = Console()
 
+# Pre-parsed styles for the recording tick (runs several times a second)
+_RECORDING_LABEL_STYLE = Style(bold=True, color="green")
+_ELAPSED_STYLE = Style(color="cyan")
+_HINT_STYLE = Style(dim=True)
+
 
 class RichUI(UIOutput):
     """Single Live spinner across recording → processing phases. Plain final output."""
@@ -17,6 +23,7 @@ class RichUI(UIOutput):
         self._console = console or _DEFAULT_CONSOLE
         self._live: Live | None = None
         self._spinner = Spinner("dots")
+        self._recording_text = Text()
 
     def _ensure_live(self) -> Live:
         if self._live is None:
@@ -52,10 +59,12 @@ class RichUI(UIOutput):
         self._console.print()
 
     def show_recording_progress(self, progress: RecordingProgress) -> None:
-        text = Text()
-        text.append("Recording ", style="bold green")
-        text.append(f"{progress.elapsed:.1f}s ", style="cyan")
-        text.append("(Enter to stop)", style="dim")
+        # Reuse one Text object: the only per-tick allocation is the elapsed string
+        text = self._recording_text
+        text.truncate(0)
+        text.append("Recording ", style=_RECORDING_LABEL_STYLE)
+        text.append(f"{progress.elapsed:.1f}s ", style=_ELAPSED_STYLE)
+        text.append("(Enter to stop)", style=_HINT_STYLE)
         self._set_phase_text(text)
 
     def show_recording_stopped(self, reason: str | None = None) -> None:
@@ -1,16 +1,27 @@
 """Configuration management using pydantic-settings."""
 
-import json
+import functools
 from enum import StrEnum
 from pathlib import Path
+from typing import ClassVar
 
-from platformdirs import user_config_dir
 from pydantic import Field
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 from shh.core.styles import TranscriptionStyle
 
 
+@functools.cache
+def _config_path() -> Path:
+    """Resolve (and create) the platform config directory once per process."""
+    # Deferred: platformdirs is only needed once a settings file is touched
+    from platformdirs import user_config_dir
+
+    config_dir = Path(user_config_dir("shh"))
+    config_dir.mkdir(parents=True, exist_ok=True)
+    return config_dir / "settings.json"
+
+
 class WhisperModel(StrEnum):
     """Available Whisper models."""
 
@@ -28,8 +39,15 @@ class Settings(BaseSettings):
         env_file_encoding="utf-8",
         env_prefix="SHH_",
         extra="ignore",
+        # Immutable (and hashable, since every field type is): the instances
+        # shared by get_settings() and the load cache can't be corrupted by a
+        # caller. Derive changed variants with model_copy(update={...}).
+        frozen=True,
     )
 
+    # (path, st_mtime_ns, parsed instance) of the last on-disk read
+    _load_cache: ClassVar["tuple[Path, int, Settings] | None"] = None
+
     openai_api_key: str | None = Field(default=None)
     default_style: TranscriptionStyle = Field(default=TranscriptionStyle.NEUTRAL)
     default_translation_language: str | None = Field(
@@ -42,7 +60,9 @@ class Settings(BaseSettings):
         description="Use minimal output (just result + 'Done')",
     )
     whisper_model: WhisperModel = Field(default=WhisperModel.WHISPER_1)
-    default_output: list[str] = Field(default_factory=lambda: ["clipboard", "stdout"])
+    # Tuple default is immutable, so pydantic shares it across instances
+    # instead of deep-copying a list per construction
+    default_output: tuple[str, ...] = Field(default=("clipboard", "stdout"))
     history_enabled: bool = Field(
         default=True,
         description="Persist transcriptions to history.jsonl.",
@@ -62,30 +82,52 @@ class Settings(BaseSettings):
         - macOS: ~/Library/Application Support/shh/settings.json
         - Linux: ~/.config/shh/settings.json
         - Windows: %APPDATA%/shh/settings.json
-        """
 
-        config_dir = Path(user_config_dir("shh"))
-        config_dir.mkdir(parents=True, exist_ok=True)
-        return config_dir / "settings.json"
+        The lookup (and the mkdir) runs once per process; tests monkeypatch
+        this classmethod, which bypasses the cache entirely.
+        """
+        return _config_path()
 
     @classmethod
     def get_history_path(cls) -> Path:
         """Path to the transcription history JSONL file."""
         return cls.get_config_path().parent / "history.jsonl"
 
+    @classmethod
+    def load_or_default(cls) -> "Settings":
+        """
+        Load settings from the config file, falling back to defaults.
+
+        Both branches may return a shared cached instance; Settings is
+        frozen, so handing it out directly is safe.
+        """
+        return cls.load_from_file() or get_settings()
+
     @classmethod
     def load_from_file(cls) -> "Settings | None":
         """
         Load settings from config file if it exists.
         Returns Settings instance or None if file not found.
+
+        Warm calls are served from an mtime-keyed cache: as long as the file
+        is unchanged on disk, repeat loads cost one stat() instead of a
+        parse + validation pass.
         """
 
         config_path = cls.get_config_path()
-        if config_path.exists():
-            with open(config_path, encoding="utf-8") as f:
-                data = json.load(f)
-            return cls.model_validate(data)
-        return None
+        try:
+            mtime_ns = config_path.stat().st_mtime_ns
+        except OSError:
+            return None
+
+        cache = cls._load_cache
+        if cache is not None and cache[0] == config_path and cache[1] == mtime_ns:
+            return cache[2]
+
+        # Single pass: pydantic-core parses and validates the JSON directly
+        settings = cls.model_validate_json(config_path.read_bytes())
+        cls._load_cache = (config_path, mtime_ns, settings)
+        return settings
 
     def save_to_file(self) -> None:
         """
@@ -93,5 +135,19 @@ class Settings(BaseSettings):
         """
 
         config_path = self.get_config_path()
-        with open(config_path, "w", encoding="utf-8") as f:
-            json.dump(self.model_dump(), f, indent=4)
+        config_path.write_text(self.model_dump_json(indent=2), encoding="utf-8")
+        # Invalidate rather than prime with self: the next load must parse
+        # what was actually written, so serialization stays covered
+        type(self)._load_cache = None
+
+
+@functools.lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """
+    Process-wide default Settings (env + .env applied), constructed once.
+
+    Each construction walks every pydantic-settings source (environment
+    scan plus .env read); caching the result turns repeat calls into a
+    dict lookup. The model is frozen, so sharing the instance is safe.
+    """
+    return Settings()
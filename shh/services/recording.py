@@ -2,6 +2,7 @@
 
 import asyncio
 import contextlib
+import os
 import sys
 import termios
 import tty
@@ -10,11 +11,11 @@ from collections.abc import Callable
 from datetime import UTC, datetime
 
 import numpy as np
-import pyperclip  # type: ignore[import-untyped]
 from numpy.typing import NDArray
 
-from shh.adapters.audio.processor import SAMPLE_RATE, save_audio_to_wav
+from shh.adapters.audio.processor import SAMPLE_RATE, save_audio_to_wav_bytes
 from shh.adapters.audio.recorder import AudioRecorder
+from shh.adapters.clipboard.manager import copy_text
 from shh.adapters.history.store import HistoryStore
 from shh.adapters.llm.formatter import format_transcription
 from shh.adapters.whisper.client import transcribe_audio
@@ -49,7 +50,7 @@ class RecordingService:
     async def record_audio(
         self,
         on_progress: Callable[[float, float], None] | None = None,
-    ) -> NDArray[np.float32]:
+    ) -> NDArray[np.int16]:
         """
         Record audio from the microphone until Enter is pressed or max duration reached.
 
@@ -63,30 +64,36 @@ class RecordingService:
             KeyboardInterrupt: If user cancels with Ctrl+C
         """
         async with AudioRecorder() as recorder:
-            # Start waiting for Enter in background
+            # Stop on whichever fires first: Enter or the max-duration timer.
             enter_task = asyncio.create_task(self._wait_for_enter())
+            timeout_task = asyncio.create_task(asyncio.sleep(recorder._max_duration))
+            progress_task = (
+                asyncio.create_task(self._report_progress(recorder, on_progress))
+                if on_progress
+                else None
+            )
 
-            # Show live progress
-            while not enter_task.done() and not recorder.is_max_duration_reached():
-                if on_progress:
-                    elapsed = recorder.elapsed_time()
-                    max_duration = recorder._max_duration
-                    on_progress(elapsed, max_duration)
-
-                await asyncio.sleep(0.1)
-
-            # Cancel Enter task if we hit max duration
-            if not enter_task.done():
-                enter_task.cancel()
-                with contextlib.suppress(asyncio.CancelledError):
-                    await enter_task
+            tasks = [t for t in (enter_task, timeout_task, progress_task) if t is not None]
+            try:
+                # The progress task only completes by raising, so including it
+                # here stops the recording as soon as the callback fails.
+                await asyncio.wait(tasks, return_when=asyncio.FIRST_COMPLETED)
+            finally:
+                # Cancel and await every task, completed ones included: a task
+                # that already died (e.g. a raising progress callback) must
+                # have its exception retrieved and re-raised, not dropped as
+                # "Task exception was never retrieved".
+                for task in tasks:
+                    task.cancel()
+                    with contextlib.suppress(asyncio.CancelledError):
+                        await task
 
             # Get recorded audio
             return recorder.get_audio()
 
     async def transcribe_and_format(
         self,
-        audio_data: NDArray[np.float32],
+        audio_data: NDArray[np.int16],
         options: RecordingOptions,
         skip_history: bool = False,
     ) -> TranscriptionOutput:
@@ -101,66 +108,61 @@ class RecordingService:
         Returns:
             TranscriptionOutput with the processed text
         """
-        self._ui.show_processing_step("Saving audio")
-        wav_path = save_audio_to_wav(audio_data)
-
-        try:
-            self._ui.show_processing_step("Transcribing")
-            whisper_result = await transcribe_audio(
-                audio_file_path=wav_path,
+        # Encode in memory - the WAV payload is uploaded directly, never written to disk
+        self._ui.show_processing_step("Encoding audio")
+        wav_bytes = await asyncio.to_thread(save_audio_to_wav_bytes, audio_data)
+
+        self._ui.show_processing_step("Transcribing")
+        whisper_result = await transcribe_audio(
+            audio=wav_bytes,
+            api_key=self.settings.openai_api_key or "",
+            model=self.settings.whisper_model,
+        )
+
+        needs_formatting = (
+            options.style != TranscriptionStyle.NEUTRAL or options.translate is not None
+        )
+
+        if needs_formatting:
+            label = "Formatting"
+            if options.translate:
+                label = f"Formatting ({options.translate})"
+            self._ui.show_processing_step(label)
+            formatted = await format_transcription(
+                whisper_result.text,
+                style=options.style,
                 api_key=self.settings.openai_api_key or "",
-                model=self.settings.whisper_model,
-            )
-
-            needs_formatting = (
-                options.style != TranscriptionStyle.NEUTRAL
-                or options.translate is not None
+                target_language=options.translate,
             )
-
-            if needs_formatting:
-                label = "Formatting"
-                if options.translate:
-                    label = f"Formatting ({options.translate})"
-                self._ui.show_processing_step(label)
-                formatted = await format_transcription(
-                    whisper_result.text,
-                    style=options.style,
-                    api_key=self.settings.openai_api_key or "",
-                    target_language=options.translate,
-                )
-                final_text = formatted.text
-            else:
-                final_text = whisper_result.text
-
-            # Copy to clipboard
-            clipboard_success = self._copy_to_clipboard(final_text)
-
-            # Persist to history
-            if self.settings.history_enabled and not skip_history:
-                entry = HistoryEntry(
-                    id=uuid.uuid4().hex[:8],
-                    ts=datetime.now(tz=UTC),
-                    text=final_text,
-                    style=options.style,
-                    translate_to=options.translate,
-                    duration_s=len(audio_data) / SAMPLE_RATE,
-                    detected_lang=whisper_result.detected_lang,
-                )
-                try:
-                    self._history_store.append(entry)
-                except OSError as exc:
-                    logger.warning(f"Failed to persist history entry: {exc}")
-
-            return TranscriptionOutput(
+            final_text = formatted.text
+        else:
+            final_text = whisper_result.text
+
+        # Copy to clipboard
+        clipboard_success = copy_text(final_text)
+
+        # Persist to history
+        if self.settings.history_enabled and not skip_history:
+            entry = HistoryEntry(
+                id=uuid.uuid4().hex[:8],
+                ts=datetime.now(tz=UTC),
                 text=final_text,
                 style=options.style,
-                translated_to=options.translate,
-                copied_to_clipboard=clipboard_success,
+                translate_to=options.translate,
+                duration_s=len(audio_data) / SAMPLE_RATE,
+                detected_lang=whisper_result.detected_lang,
             )
-
-        finally:
-            with contextlib.suppress(Exception):
-                wav_path.unlink(missing_ok=True)
+            try:
+                self._history_store.append(entry)
+            except OSError as exc:
+                logger.warning(f"Failed to persist history entry: {exc}")
+
+        return TranscriptionOutput(
+            text=final_text,
+            style=options.style,
+            translated_to=options.translate,
+            copied_to_clipboard=clipboard_success,
+        )
 
     async def record_and_transcribe(
         self,
@@ -184,11 +186,24 @@ class RecordingService:
 
         return await self.transcribe_and_format(audio_data, options)
 
+    @staticmethod
+    async def _report_progress(
+        recorder: AudioRecorder,
+        on_progress: Callable[[float, float], None],
+        interval: float = 0.25,
+    ) -> None:
+        """Tick the progress callback at a low cadence until cancelled."""
+        max_duration = recorder._max_duration
+        while True:
+            on_progress(recorder.elapsed_time(), max_duration)
+            await asyncio.sleep(interval)
+
     @staticmethod
     def _wait_for_enter_blocking() -> None:
-        """Block until Enter is pressed. Uses cbreak mode on a TTY to suppress
-        the echoed newline that would otherwise interfere with rich.live.Live's
-        cursor anchor. Falls back to readline for non-TTY stdin (tests, pipes).
+        """Thread-pool fallback for loops that cannot watch stdin: block until
+        Enter is pressed. Uses cbreak mode on a TTY to suppress the echoed
+        newline that would otherwise interfere with rich.live.Live's cursor
+        anchor; reads a line for non-TTY stdin (tests, pipes).
         """
         if not sys.stdin.isatty():
             sys.stdin.readline()
@@ -206,23 +221,41 @@ class RecordingService:
 
     @staticmethod
     async def _wait_for_enter() -> None:
-        """Wait for user to press Enter (runs in thread pool)."""
-        loop = asyncio.get_running_loop()
-        await loop.run_in_executor(None, RecordingService._wait_for_enter_blocking)
+        """Wait for user to press Enter.
 
-    @staticmethod
-    def _copy_to_clipboard(text: str) -> bool:
+        The event loop watches stdin via add_reader (epoll/kqueue), so no
+        executor thread is parked on a blocking read - cancelling this task
+        on the max-duration timeout cannot leak one. Falls back to the
+        thread pool when stdin has no usable fd or the loop cannot watch it.
         """
-        Copy text to clipboard.
+        loop = asyncio.get_running_loop()
+        enter_pressed = asyncio.Event()
 
-        Args:
-            text: Text to copy
+        try:
+            fd = sys.stdin.fileno()
 
-        Returns:
-            True if successful, False otherwise
-        """
+            def _on_readable() -> None:
+                try:
+                    data = os.read(fd, 64)
+                except OSError:
+                    enter_pressed.set()
+                    return
+                if not data or b"\n" in data or b"\r" in data:
+                    enter_pressed.set()
+
+            loop.add_reader(fd, _on_readable)
+        except (ValueError, OSError, NotImplementedError):
+            await loop.run_in_executor(None, RecordingService._wait_for_enter_blocking)
+            return
+
+        # cbreak on a TTY suppresses the echoed newline that would otherwise
+        # interfere with rich.live.Live's cursor anchor.
+        old_settings = termios.tcgetattr(fd) if sys.stdin.isatty() else None
         try:
-            pyperclip.copy(text)
-            return True
-        except Exception:
-            return False
+            if old_settings is not None:
+                tty.setcbreak(fd)
+            await enter_pressed.wait()
+        finally:
+            loop.remove_reader(fd)
+            if old_settings is not None:
+                termios.tcsetattr(fd, termios.TCSADRAIN, old_settings)
@@ -10,41 +10,61 @@ import pytest
 from shh.config.settings import Settings
 
 
-@pytest.fixture
-def temp_config_dir(tmp_path: Path) -> Generator[Path, None, None]:
-    """Provide a temporary config directory for testing."""
-    config_dir = tmp_path / "config"
-    config_dir.mkdir()
-    yield config_dir
+@pytest.fixture(scope="session", autouse=True)
+def isolated_config_path(tmp_path_factory: pytest.TempPathFactory) -> Generator[Path, None, None]:
+    """Point every test at a throwaway settings.json, patched once per session.
+
+    Keeps the suite off the real user config and removes the per-test
+    monkeypatch + mkdir churn the tests used to repeat individually.
+    """
+    config_path = tmp_path_factory.mktemp("shh-config") / "settings.json"
+    mp = pytest.MonkeyPatch()
+    mp.setattr(
+        "shh.config.settings.Settings.get_config_path",
+        classmethod(lambda cls: config_path),
+    )
+    yield config_path
+    mp.undo()
 
 
-@pytest.fixture
-def mock_settings(temp_config_dir: Path, monkeypatch: pytest.MonkeyPatch) -> Settings:
-    """Provide mock settings with test API key."""
+@pytest.fixture(autouse=True)
+def _fresh_config(isolated_config_path: Path) -> None:
+    """Each test starts without a settings file."""
+    isolated_config_path.unlink(missing_ok=True)
 
-    # Mock the config path to use temp directory
-    def get_test_config_path(cls: type) -> Path:
-        return temp_config_dir / "settings.json"
 
-    monkeypatch.setattr(
-        "shh.config.settings.Settings.get_config_path",
-        classmethod(get_test_config_path),
-    )
+@pytest.fixture(scope="session")
+def baseline_settings() -> Settings:
+    """Default Settings validated once per session.
 
-    settings = Settings(openai_api_key="sk-test-key-1234567890")
+    Derive per-test variants with ``model_copy(update={...})`` instead of
+    re-running the full pydantic source chain; tests that exercise
+    construction or validation itself keep calling ``Settings(...)``.
+    """
+    return Settings()
+
+
+@pytest.fixture
+def mock_settings(isolated_config_path: Path, baseline_settings: Settings) -> Settings:
+    """Provide mock settings with test API key."""
+    settings = baseline_settings.model_copy(update={"openai_api_key": "sk-test-key-1234567890"})
     settings.save_to_file()
     return settings
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_audio_1s() -> np.ndarray:
-    """Generate 1 second of sample audio (440Hz sine wave)."""
+    """1 second of sample audio (440Hz sine wave), computed once per session.
+
+    Marked read-only so a test mutating the shared array fails loudly.
+    """
     sample_rate = 16000
-    duration = 1.0
     frequency = 440.0  # A note
 
-    t = np.linspace(0, duration, int(sample_rate * duration), dtype=np.float32)
-    return np.sin(2 * np.pi * frequency * t).astype(np.float32)
+    step = np.float32(2 * np.pi * frequency / sample_rate)
+    signal = np.sin(np.arange(sample_rate, dtype=np.float32) * step)
+    signal.setflags(write=False)
+    return signal
 
 
 @pytest.fixture
@@ -1,5 +1,6 @@
 """Integration tests for the full recording flow (with mocked APIs)."""
 
+from collections.abc import Generator
 from pathlib import Path
 from unittest.mock import AsyncMock, MagicMock, patch
 
@@ -8,8 +9,8 @@ import pytest
 
 from shh.adapters.audio.processor import save_audio_to_wav
 from shh.adapters.history.store import HistoryStore
-from shh.adapters.llm.formatter import format_transcription
-from shh.adapters.whisper.client import transcribe_audio
+from shh.adapters.llm.formatter import _get_agent, format_transcription
+from shh.adapters.whisper.client import _get_client, transcribe_audio
 from shh.cli.ui.base import RecordingProgress, TranscriptionResult
 from shh.config.settings import Settings
 from shh.core.models import RecordingOptions
@@ -17,6 +18,27 @@ from shh.core.styles import TranscriptionStyle
 from shh.services.recording import RecordingService
 
 
+@pytest.fixture(autouse=True)
+def _fresh_client_cache() -> Generator[None, None, None]:
+    """Drop the per-key caches so each test sees its own patched client/agent."""
+    _get_client.cache_clear()
+    _get_agent.cache_clear()
+    yield
+
+
+@pytest.fixture(scope="session")
+def shared_wav(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """One silent WAV shared by every test that only needs a valid file.
+
+    The mocked APIs never look at the samples, so a zero-filled buffer
+    written once replaces a per-test randn + WAV write + unlink.
+    """
+    audio = np.zeros(16000, dtype=np.float32)
+    wav_path = save_audio_to_wav(audio)
+    # Move into pytest's session tmp dir so cleanup is automatic
+    return wav_path.rename(tmp_path_factory.mktemp("shh-audio") / wav_path.name)
+
+
 class _FakeUI:
     def __init__(self) -> None:
         self.processing_steps: list[str] = []
@@ -51,50 +73,34 @@ class _FakeUI:
 
 
 @pytest.mark.asyncio
-async def test_transcribe_audio_success(tmp_path: Path) -> None:
+async def test_transcribe_audio_success(shared_wav: Path) -> None:
     """Test successful transcription with mocked OpenAI API."""
-    audio_data = np.random.randn(16000).astype(np.float32) * 0.5
-    wav_path = save_audio_to_wav(audio_data)
-
-    try:
-        with patch("shh.adapters.whisper.client.AsyncOpenAI") as mock_client:
-            mock_transcription = MagicMock()
-            mock_transcription.text = "Hello, this is a test transcription."
-            mock_transcription.language = "en"
-
-            mock_instance = mock_client.return_value
-            mock_instance.audio.transcriptions.create = AsyncMock(return_value=mock_transcription)
+    with patch("shh.adapters.whisper.client.AsyncOpenAI") as mock_client:
+        mock_transcription = MagicMock()
+        mock_transcription.text = "Hello, this is a test transcription."
+        mock_transcription.language = "en"
 
-            result = await transcribe_audio(
-                audio_file_path=wav_path,
-                api_key="sk-test-key",
-            )
+        mock_instance = mock_client.return_value
+        mock_instance.audio.transcriptions.create = AsyncMock(return_value=mock_transcription)
 
-            assert result.text == "Hello, this is a test transcription."
-            mock_instance.audio.transcriptions.create.assert_called_once()
+        result = await transcribe_audio(
+            audio=shared_wav,
+            api_key="sk-test-key",
+        )
 
-    finally:
-        wav_path.unlink(missing_ok=True)
+        assert result.text == "Hello, this is a test transcription."
+        mock_instance.audio.transcriptions.create.assert_called_once()
 
 
 @pytest.mark.asyncio
-async def test_transcribe_audio_api_error(tmp_path: Path) -> None:
+async def test_transcribe_audio_api_error(shared_wav: Path) -> None:
     """Test that transcription errors are properly raised."""
-    audio_data = np.random.randn(16000).astype(np.float32) * 0.5
-    wav_path = save_audio_to_wav(audio_data)
-
-    try:
-        with patch("shh.adapters.whisper.client.AsyncOpenAI") as mock_client:
-            mock_instance = mock_client.return_value
-            mock_instance.audio.transcriptions.create = AsyncMock(
-                side_effect=Exception("API Error")
-            )
-
-            with pytest.raises(Exception, match="Failed to transcribe audio"):
-                await transcribe_audio(wav_path, "sk-test-key")
+    with patch("shh.adapters.whisper.client.AsyncOpenAI") as mock_client:
+        mock_instance = mock_client.return_value
+        mock_instance.audio.transcriptions.create = AsyncMock(side_effect=Exception("API Error"))
 
-    finally:
-        wav_path.unlink(missing_ok=True)
+        with pytest.raises(Exception, match="Failed to transcribe audio"):
+            await transcribe_audio(shared_wav, "sk-test-key")
 
 
 @pytest.mark.asyncio
@@ -111,6 +117,20 @@ async def test_format_transcription_neutral() -> None:
     assert result.text == text
 
 
+@pytest.mark.asyncio
+async def test_format_transcription_empty_text_skips_llm() -> None:
+    """Test that empty/whitespace text short-circuits without an LLM call."""
+    with patch("shh.adapters.llm.formatter.Agent") as mock_agent_class:
+        result = await format_transcription(
+            "   ",
+            style=TranscriptionStyle.BUSINESS,
+            api_key="sk-test-key",
+        )
+
+        assert result.text == "   "
+        mock_agent_class.assert_not_called()
+
+
 @pytest.mark.asyncio
 async def test_format_transcription_casual() -> None:
     """Test casual formatting with mocked PydanticAI."""
@@ -166,46 +186,39 @@ async def test_format_transcription_with_translation() -> None:
 
 
 @pytest.mark.asyncio
-async def test_full_pipeline_mock(tmp_path: Path) -> None:
+async def test_full_pipeline_mock(shared_wav: Path) -> None:
     """Test the complete pipeline: audio → transcribe → format."""
-    audio_data = np.random.randn(16000).astype(np.float32) * 0.5
-    wav_path = save_audio_to_wav(audio_data)
-
-    try:
-        with patch("shh.adapters.whisper.client.AsyncOpenAI") as mock_whisper:
-            mock_transcription = MagicMock()
-            mock_transcription.text = "Um, this is a test transcription."
-            mock_transcription.language = "en"
-
-            mock_whisper_instance = mock_whisper.return_value
-            mock_whisper_instance.audio.transcriptions.create = AsyncMock(
-                return_value=mock_transcription
-            )
-
-            whisper_result = await transcribe_audio(wav_path, "sk-test-key")
-            assert whisper_result.text == "Um, this is a test transcription."
+    with patch("shh.adapters.whisper.client.AsyncOpenAI") as mock_whisper:
+        mock_transcription = MagicMock()
+        mock_transcription.text = "Um, this is a test transcription."
+        mock_transcription.language = "en"
+
+        mock_whisper_instance = mock_whisper.return_value
+        mock_whisper_instance.audio.transcriptions.create = AsyncMock(
+            return_value=mock_transcription
+        )
 
-            with (
-                patch("shh.adapters.llm.formatter.OpenAIChatModel"),
-                patch("shh.adapters.llm.formatter.Agent") as mock_agent_class,
-            ):
-                mock_agent = MagicMock()
-                mock_result = MagicMock()
-                mock_result.output.text = "This is a test transcription."
+        whisper_result = await transcribe_audio(shared_wav, "sk-test-key")
+        assert whisper_result.text == "Um, this is a test transcription."
 
-                mock_agent.run = AsyncMock(return_value=mock_result)
-                mock_agent_class.return_value = mock_agent
+        with (
+            patch("shh.adapters.llm.formatter.OpenAIChatModel"),
+            patch("shh.adapters.llm.formatter.Agent") as mock_agent_class,
+        ):
+            mock_agent = MagicMock()
+            mock_result = MagicMock()
+            mock_result.output.text = "This is a test transcription."
 
-                formatted = await format_transcription(
-                    whisper_result.text,
-                    style=TranscriptionStyle.CASUAL,
-                    api_key="sk-test-key",
-                )
+            mock_agent.run = AsyncMock(return_value=mock_result)
+            mock_agent_class.return_value = mock_agent
 
-                assert formatted.text == "This is a test transcription."
+            formatted = await format_transcription(
+                whisper_result.text,
+                style=TranscriptionStyle.CASUAL,
+                api_key="sk-test-key",
+            )
 
-    finally:
-        wav_path.unlink(missing_ok=True)
+            assert formatted.text == "This is a test transcription."
 
 
 @pytest.mark.asyncio
@@ -216,26 +229,20 @@ async def test_service_full_pipeline_mock(tmp_path: Path) -> None:
     store = HistoryStore(path=tmp_path / "history.jsonl", retention=200)
     service = RecordingService(settings=settings, ui=fake_ui, history_store=store)
 
-    audio_data = np.random.randn(16000).astype(np.float32) * 0.5
+    audio_data = np.zeros(16000, dtype=np.float32)
     options = RecordingOptions(style=TranscriptionStyle.CASUAL)
 
     with (
-        patch("shh.services.recording.save_audio_to_wav") as mock_save,
+        patch("shh.services.recording.save_audio_to_wav_bytes", return_value=b"RIFF"),
         patch("shh.services.recording.transcribe_audio") as mock_transcribe,
         patch("shh.services.recording.format_transcription") as mock_format,
-        patch("shh.services.recording.pyperclip.copy"),
+        patch("shh.services.recording.copy_text", return_value=True),
     ):
-        temp_file = tmp_path / "test.wav"
-        mock_save.return_value = temp_file
-        mock_transcribe.return_value = MagicMock(
-            text="Um, test transcription.", detected_lang="en"
-        )
+        mock_transcribe.return_value = MagicMock(text="Um, test transcription.", detected_lang="en")
 
         mock_formatted = MagicMock()
         mock_formatted.text = "Test transcription."
         mock_format.return_value = mock_formatted
-        temp_file.touch()
-
         result = await service.transcribe_and_format(audio_data, options)
 
     assert result.text == "Test transcription."
@@ -1,25 +1,37 @@
 """Unit tests for audio processor."""
 
+import io
+
 import numpy as np
 import pytest
 from numpy.typing import NDArray
 from scipy.io import wavfile
 
-from shh.adapters.audio.processor import SAMPLE_RATE, save_audio_to_wav
+from shh.adapters.audio.processor import SAMPLE_RATE, save_audio_to_wav, save_audio_to_wav_bytes
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_audio_data() -> NDArray[np.float32]:
-    """Generate sample audio data for testing.
+    """Sample audio data for testing: 1 second of 440Hz sine (A note).
 
-    Returns 1 second of sine wave at 440Hz (A note).
+    Computed once per session and marked read-only so a test mutating the
+    shared array fails loudly.
     """
-    duration = 1.0  # seconds
     frequency = 440.0  # Hz (A note)
-    samples = int(SAMPLE_RATE * duration)
 
-    t = np.linspace(0, duration, samples, dtype=np.float32)
-    return np.sin(2 * np.pi * frequency * t).astype(np.float32)
+    step = np.float32(2 * np.pi * frequency / SAMPLE_RATE)
+    signal = np.sin(np.arange(SAMPLE_RATE, dtype=np.float32) * step)
+    signal.setflags(write=False)
+    return signal
+
+
+def _roundtrip(
+    audio_data: NDArray[np.float32] | NDArray[np.int16],
+    sample_rate: int = SAMPLE_RATE,
+) -> tuple[int, NDArray[np.int16]]:
+    """Encode audio in memory and decode it back - no disk round-trip."""
+    wav_bytes = save_audio_to_wav_bytes(audio_data, sample_rate=sample_rate)
+    return wavfile.read(io.BytesIO(wav_bytes))
 
 
 def test_save_audio_to_wav_creates_file(sample_audio_data: NDArray[np.float32]) -> None:
@@ -35,76 +47,68 @@ def test_save_audio_to_wav_creates_file(sample_audio_data: NDArray[np.float32])
             wav_path.unlink()
 
 
-def test_save_audio_to_wav_correct_sample_rate(sample_audio_data: NDArray[np.float32]) -> None:
-    """Test that saved WAV file has correct sample rate."""
+def test_save_audio_to_wav_matches_bytes_encoding(sample_audio_data: NDArray[np.float32]) -> None:
+    """Test that the file and in-memory encoders produce identical payloads."""
     wav_path = save_audio_to_wav(sample_audio_data)
 
     try:
-        sample_rate, _ = wavfile.read(wav_path)
-        assert sample_rate == SAMPLE_RATE, f"Sample rate should be {SAMPLE_RATE}Hz"
+        assert wav_path.read_bytes() == save_audio_to_wav_bytes(sample_audio_data)
     finally:
         if wav_path.exists():
             wav_path.unlink()
 
 
-def test_save_audio_to_wav_correct_data_conversion(sample_audio_data: NDArray[np.float32]) -> None:
-    """Test that audio data is correctly converted from float32 to int16."""
-    wav_path = save_audio_to_wav(sample_audio_data)
+def test_wav_bytes_correct_sample_rate(sample_audio_data: NDArray[np.float32]) -> None:
+    """Test that the encoded WAV has the correct sample rate."""
+    sample_rate, _ = _roundtrip(sample_audio_data)
+    assert sample_rate == SAMPLE_RATE, f"Sample rate should be {SAMPLE_RATE}Hz"
 
-    try:
-        _, audio_int16 = wavfile.read(wav_path)
-        assert audio_int16.dtype == np.int16, "Audio data should be int16"
 
-        audio_float_reconstructed = audio_int16.astype(np.float32) / 32767.0
+def test_wav_bytes_correct_data_conversion(sample_audio_data: NDArray[np.float32]) -> None:
+    """Test that audio data is correctly converted from float32 to int16."""
+    _, audio_int16 = _roundtrip(sample_audio_data)
+    assert audio_int16.dtype == np.int16, "Audio data should be int16"
 
-        np.testing.assert_allclose(
-            audio_float_reconstructed,
-            sample_audio_data,
-            atol=1e-4,
-            err_msg="Reconstructed audio should match original (within conversion tolerance)",
-        )
-    finally:
-        if wav_path.exists():
-            wav_path.unlink()
+    audio_float_reconstructed = audio_int16.astype(np.float32) / 32767.0
 
+    np.testing.assert_allclose(
+        audio_float_reconstructed,
+        sample_audio_data,
+        atol=1e-4,
+        err_msg="Reconstructed audio should match original (within conversion tolerance)",
+    )
 
-def test_save_audio_to_wav_custom_sample_rate() -> None:
+
+def test_wav_bytes_custom_sample_rate() -> None:
     """Test that custom sample rate is respected."""
     custom_rate = 44100
     duration = 0.5
     samples = int(custom_rate * duration)
     audio_data = np.random.randn(samples).astype(np.float32) * 0.5
 
-    wav_path = save_audio_to_wav(audio_data, sample_rate=custom_rate)
-
-    try:
-        sample_rate, _ = wavfile.read(wav_path)
-        assert sample_rate == custom_rate, f"Sample rate should be {custom_rate}Hz"
-    finally:
-        if wav_path.exists():
-            wav_path.unlink()
+    sample_rate, _ = _roundtrip(audio_data, sample_rate=custom_rate)
+    assert sample_rate == custom_rate, f"Sample rate should be {custom_rate}Hz"
 
 
-def test_save_audio_to_wav_handles_empty_array() -> None:
-    """Test that empty audio array raises an error or handles gracefully."""
+def test_wav_bytes_handles_empty_array() -> None:
+    """Test that an empty audio array still produces a valid header."""
     empty_audio = np.array([], dtype=np.float32)
-    wav_path = save_audio_to_wav(empty_audio)
+    wav_bytes = save_audio_to_wav_bytes(empty_audio)
 
-    try:
-        assert wav_path.exists(), "Should create file even for empty audio"
-    finally:
-        if wav_path.exists():
-            wav_path.unlink()
+    assert len(wav_bytes) == 44, "Empty audio should produce a header-only payload"
 
 
-def test_save_audio_to_wav_handles_large_values() -> None:
+def test_wav_bytes_accepts_int16() -> None:
+    """Test that int16 audio (the recorder's native dtype) is written as-is."""
+    audio_data = np.array([0, 1000, -1000, 32767], dtype=np.int16)
+    _, audio_int16 = _roundtrip(audio_data)
+    np.testing.assert_array_equal(audio_int16, audio_data)
+
+
+def test_wav_bytes_handles_large_values() -> None:
     """Test that audio values outside [-1.0, 1.0] are clipped correctly."""
     audio_data = np.array([0.5, 1.5, -1.5, 0.0], dtype=np.float32)
-    wav_path = save_audio_to_wav(audio_data)
+    _, audio_int16 = _roundtrip(audio_data)
 
-    try:
-        _, audio_int16 = wavfile.read(wav_path)
-        assert audio_int16.dtype == np.int16
-    finally:
-        if wav_path.exists():
-            wav_path.unlink()
+    assert audio_int16.dtype == np.int16
+    np.testing.assert_array_equal(audio_int16[1:3], [32767, -32768])
@@ -1,15 +1,23 @@
 """Tests for the Whisper adapter."""
 
+from collections.abc import Generator
 from pathlib import Path
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
-from shh.adapters.whisper.client import transcribe_audio
+from shh.adapters.whisper.client import _get_client, transcribe_audio
 from shh.core.models import WhisperTranscription
 from shh.utils.exceptions import TranscriptionError
 
 
+@pytest.fixture(autouse=True)
+def _fresh_client_cache() -> Generator[None, None, None]:
+    """Drop the per-key client cache so each test sees its own patched client."""
+    _get_client.cache_clear()
+    yield
+
+
 @pytest.mark.asyncio
 async def test_transcribe_audio_returns_whisper_transcription(tmp_path: Path) -> None:
     audio = tmp_path / "audio.wav"
@@ -34,6 +42,23 @@ async def test_transcribe_audio_returns_whisper_transcription(tmp_path: Path) ->
     assert kwargs["file"] is not None
 
 
+@pytest.mark.asyncio
+async def test_transcribe_audio_accepts_bytes() -> None:
+    fake_response = MagicMock()
+    fake_response.text = "from memory"
+    fake_response.language = "english"
+
+    fake_client = MagicMock()
+    fake_client.audio.transcriptions.create = AsyncMock(return_value=fake_response)
+
+    with patch("shh.adapters.whisper.client.AsyncOpenAI", return_value=fake_client):
+        result = await transcribe_audio(b"RIFF\x00\x00\x00\x00WAVE", api_key="sk-test")
+
+    assert result.text == "from memory"
+    kwargs = fake_client.audio.transcriptions.create.call_args.kwargs
+    assert kwargs["file"] == ("audio.wav", b"RIFF\x00\x00\x00\x00WAVE", "audio/wav")
+
+
 @pytest.mark.asyncio
 async def test_transcribe_audio_wraps_errors(tmp_path: Path) -> None:
     audio = tmp_path / "audio.wav"
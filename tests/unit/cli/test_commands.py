@@ -1,7 +1,6 @@
 """Unit tests for CLI commands."""
 
 from pathlib import Path
-from unittest.mock import MagicMock, patch
 
 import pytest
 from typer.testing import CliRunner
@@ -26,25 +25,15 @@ def test_cli_help() -> None:
     assert "config" in result.stdout
 
 
-def test_setup_command(temp_config_dir: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+def test_setup_command(isolated_config_path: Path) -> None:
     """Test setup command saves API key."""
-    config_file = temp_config_dir / "settings.json"
-
-    def get_test_config_path(cls: type) -> Path:
-        return config_file
-
-    monkeypatch.setattr(
-        "shh.config.settings.Settings.get_config_path",
-        classmethod(get_test_config_path),
-    )
-
     result = runner.invoke(app, ["setup"], input="sk-test-key-12345678\n")
 
     assert result.exit_code == 0
     assert "Setup Complete" in result.stdout
     assert "sk-***5678" in result.stdout
 
-    assert config_file.exists()
+    assert isolated_config_path.exists()
     settings = Settings.load_from_file()
     assert settings is not None
     assert settings.openai_api_key == "sk-test-key-12345678"
@@ -131,31 +120,16 @@ def test_config_reset_cancelled(mock_settings: Settings) -> None:
     assert "Reset cancelled" in result.stdout
 
 
-@patch("shh.cli.commands.record.record_command")
-def test_record_command_no_api_key(
-    mock_record: MagicMock,
-    temp_config_dir: Path,
-    monkeypatch: pytest.MonkeyPatch,
-) -> None:
+def test_record_command_no_api_key() -> None:
     """Test that record command fails without API key."""
-    config_file = temp_config_dir / "settings.json"
-
-    def get_test_config_path(cls: type) -> Path:
-        return config_file
-
-    monkeypatch.setattr(
-        "shh.config.settings.Settings.get_config_path",
-        classmethod(get_test_config_path),
-    )
-
-    # Don't create config file (no API key)
+    # No config file exists (autouse isolation), so there is no API key
     result = runner.invoke(app, [])
 
     # Should fail with error about missing API key
     # Error may go to stderr (PipeUI when not a TTY) or stdout (RichUI)
     assert result.exit_code == 1
     combined = result.stdout + result.stderr
-    assert "No API key found" in combined or mock_record.called
+    assert "No API key found" in combined
 
 
 def test_record_command_uses_pipe_ui_when_not_tty(monkeypatch: pytest.MonkeyPatch) -> None:
@@ -195,9 +169,7 @@ def test_record_command_uses_quiet_ui_when_config_default_and_no_verbose(
     assert isinstance(ui, QuietUI)
 
 
-def test_config_set_history_enabled(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
-    settings_file = tmp_path / "settings.json"
-    monkeypatch.setattr(Settings, "get_config_path", classmethod(lambda cls: settings_file))
+def test_config_set_history_enabled() -> None:
     result = CliRunner().invoke(app, ["config", "set", "history_enabled", "false"])
     assert result.exit_code == 0, result.output
     loaded = Settings.load_from_file()
@@ -205,9 +177,7 @@ def test_config_set_history_enabled(tmp_path: Path, monkeypatch: pytest.MonkeyPa
     assert loaded.history_enabled is False
 
 
-def test_config_set_history_retention(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
-    settings_file = tmp_path / "settings.json"
-    monkeypatch.setattr(Settings, "get_config_path", classmethod(lambda cls: settings_file))
+def test_config_set_history_retention() -> None:
     result = CliRunner().invoke(app, ["config", "set", "history_retention", "50"])
     assert result.exit_code == 0, result.output
     loaded = Settings.load_from_file()
@@ -5,40 +5,40 @@ from pathlib import Path
 import pytest
 from pydantic import ValidationError
 
-from shh.config.settings import Settings, WhisperModel
+from shh.config.settings import Settings, WhisperModel, get_settings
 from shh.core.styles import TranscriptionStyle
 
 
-def test_settings_defaults(monkeypatch: pytest.MonkeyPatch) -> None:
-    """Test that Settings has correct default values."""
-    # Clear environment variables that could interfere
-    monkeypatch.delenv("SHH_OPENAI_API_KEY", raising=False)
-    monkeypatch.delenv("OPENAI_API_KEY", raising=False)
-
-    # Disable .env file loading for this test
-    monkeypatch.setattr(
-        "shh.config.settings.Settings.model_config",
-        {
-            "env_prefix": "SHH_",
-            "extra": "ignore",
-        },
-    )
+@pytest.fixture
+def clean_env(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Strip API-key variables that would leak into default-value assertions."""
+    for key in ("SHH_OPENAI_API_KEY", "OPENAI_API_KEY"):
+        monkeypatch.delenv(key, raising=False)
 
-    settings = Settings()
+
+@pytest.mark.usefixtures("clean_env")
+def test_settings_defaults() -> None:
+    """Test that Settings has correct default values."""
+    # _env_file=None disables dotenv loading for this construction without
+    # touching model_config (replacing that dict would invalidate pydantic's
+    # cached schema for every later test)
+    settings = Settings(_env_file=None)
 
     assert settings.openai_api_key is None
     assert settings.default_style == TranscriptionStyle.NEUTRAL
     assert settings.show_progress is True
     assert settings.whisper_model == WhisperModel.WHISPER_1
-    assert settings.default_output == ["clipboard", "stdout"]
+    assert settings.default_output == ("clipboard", "stdout")
 
 
-def test_settings_custom_values() -> None:
-    """Test Settings with custom values."""
-    settings = Settings(
-        openai_api_key="sk-custom",
-        default_style=TranscriptionStyle.CASUAL,
-        show_progress=False,
+def test_settings_custom_values(baseline_settings: Settings) -> None:
+    """Test deriving custom settings from the session baseline."""
+    settings = baseline_settings.model_copy(
+        update={
+            "openai_api_key": "sk-custom",
+            "default_style": TranscriptionStyle.CASUAL,
+            "show_progress": False,
+        }
     )
 
     assert settings.openai_api_key == "sk-custom"
@@ -55,32 +55,19 @@ def test_settings_get_config_path() -> None:
     assert "shh" in str(config_path)
 
 
-def test_settings_save_and_load(temp_config_dir: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+def test_settings_save_and_load() -> None:
     """Test saving and loading settings from file."""
-    # Mock config path
-    config_file = temp_config_dir / "settings.json"
-
-    def get_test_config_path(cls: type) -> Path:
-        return config_file
-
-    monkeypatch.setattr(
-        "shh.config.settings.Settings.get_config_path",
-        classmethod(get_test_config_path),
-    )
-
-    # Create and save settings
     settings = Settings(
         openai_api_key="sk-test-123",
         default_style=TranscriptionStyle.BUSINESS,
     )
     settings.save_to_file()
 
-    # Verify file exists
-    assert config_file.exists()
-
-    # Load and verify
+    # Load and verify (a successful load transitively proves the file exists)
     loaded = Settings.load_from_file()
     assert loaded is not None
+    # A fresh parse of the persisted JSON, not the instance we saved
+    assert loaded is not settings
     assert loaded.openai_api_key == "sk-test-123"
     assert loaded.default_style == TranscriptionStyle.BUSINESS
 
@@ -91,13 +78,14 @@ def test_settings_load_nonexistent() -> None:
     assert result is None or isinstance(result, Settings)
 
 
-def test_settings_enum_validation() -> None:
+@pytest.mark.parametrize(
+    ("field", "value"),
+    [("default_style", "invalid"), ("whisper_model", "gpt-4")],
+)
+def test_settings_enum_validation(field: str, value: str) -> None:
     """Test that enum fields are validated."""
     with pytest.raises(ValueError):
-        Settings(default_style="invalid")  # type: ignore[arg-type]
-
-    with pytest.raises(ValueError):
-        Settings(whisper_model="gpt-4")  # type: ignore[arg-type]
+        Settings(**{field: value})
 
 
 def test_settings_history_defaults() -> None:
@@ -116,6 +104,24 @@ def test_settings_history_retention_bounds_upper() -> None:
         Settings(history_retention=20_000)
 
 
+def test_get_settings_returns_cached_instance() -> None:
+    """get_settings constructs once and serves the same instance after."""
+    get_settings.cache_clear()
+    first = get_settings()
+    assert get_settings() is first
+    # With no config file on disk, load_or_default serves the same
+    # frozen instance - sharing is safe because it can't be mutated
+    assert Settings.load_or_default() is first
+
+
+def test_settings_frozen() -> None:
+    """Instances are immutable; updates go through model_copy."""
+    settings = Settings()
+    with pytest.raises(ValidationError):
+        settings.openai_api_key = "sk-other"  # type: ignore[misc]
+    assert settings.model_copy(update={"openai_api_key": "sk-other"}).openai_api_key == "sk-other"
+
+
 def test_get_history_path_alongside_settings(
     tmp_path: Path, monkeypatch: pytest.MonkeyPatch
 ) -> None:
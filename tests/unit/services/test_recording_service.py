@@ -69,17 +69,13 @@ async def test_transcribe_and_format_neutral(tmp_path: Path) -> None:
     options = RecordingOptions(style=TranscriptionStyle.NEUTRAL)
 
     with (
-        patch("shh.services.recording.save_audio_to_wav") as mock_save,
+        patch("shh.services.recording.save_audio_to_wav_bytes", return_value=b"RIFF"),
         patch("shh.services.recording.transcribe_audio") as mock_transcribe,
-        patch("shh.services.recording.pyperclip.copy") as mock_clipboard,
+        patch("shh.services.recording.copy_text", return_value=True) as mock_clipboard,
     ):
-        temp_file = tmp_path / "test.wav"
-        mock_save.return_value = temp_file
         mock_transcribe.return_value = WhisperTranscription(
             text="Test transcription", detected_lang="en"
         )
-        temp_file.touch()
-
         result = await service.transcribe_and_format(audio_data, options)
 
         assert result.text == "Test transcription"
@@ -99,13 +95,11 @@ async def test_transcribe_and_format_with_style(tmp_path: Path) -> None:
     options = RecordingOptions(style=TranscriptionStyle.CASUAL)
 
     with (
-        patch("shh.services.recording.save_audio_to_wav") as mock_save,
+        patch("shh.services.recording.save_audio_to_wav_bytes", return_value=b"RIFF"),
         patch("shh.services.recording.transcribe_audio") as mock_transcribe,
         patch("shh.services.recording.format_transcription") as mock_format,
-        patch("shh.services.recording.pyperclip.copy"),
+        patch("shh.services.recording.copy_text", return_value=True),
     ):
-        temp_file = tmp_path / "test.wav"
-        mock_save.return_value = temp_file
         mock_transcribe.return_value = WhisperTranscription(
             text="Um, test transcription, you know", detected_lang="en"
         )
@@ -114,8 +108,6 @@ async def test_transcribe_and_format_with_style(tmp_path: Path) -> None:
         mock_formatted_result.text = "Test transcription"
         mock_format.return_value = mock_formatted_result
 
-        temp_file.touch()
-
         result = await service.transcribe_and_format(audio_data, options)
 
         assert result.text == "Test transcription"
@@ -133,13 +125,11 @@ async def test_transcribe_and_format_with_translation(tmp_path: Path) -> None:
     options = RecordingOptions(style=TranscriptionStyle.NEUTRAL, translate="English")
 
     with (
-        patch("shh.services.recording.save_audio_to_wav") as mock_save,
+        patch("shh.services.recording.save_audio_to_wav_bytes", return_value=b"RIFF"),
         patch("shh.services.recording.transcribe_audio") as mock_transcribe,
         patch("shh.services.recording.format_transcription") as mock_format,
-        patch("shh.services.recording.pyperclip.copy"),
+        patch("shh.services.recording.copy_text", return_value=True),
     ):
-        temp_file = tmp_path / "test.wav"
-        mock_save.return_value = temp_file
         mock_transcribe.return_value = WhisperTranscription(
             text="Bonjour, ceci est un test", detected_lang="fr"
         )
@@ -148,8 +138,6 @@ async def test_transcribe_and_format_with_translation(tmp_path: Path) -> None:
         mock_formatted_result.text = "Hello, this is a test"
         mock_format.return_value = mock_formatted_result
 
-        temp_file.touch()
-
         result = await service.transcribe_and_format(audio_data, options)
 
         assert result.text == "Hello, this is a test"
@@ -167,18 +155,14 @@ async def test_clipboard_failure(tmp_path: Path) -> None:
     options = RecordingOptions(style=TranscriptionStyle.NEUTRAL)
 
     with (
-        patch("shh.services.recording.save_audio_to_wav") as mock_save,
+        patch("shh.services.recording.save_audio_to_wav_bytes", return_value=b"RIFF"),
         patch("shh.services.recording.transcribe_audio") as mock_transcribe,
-        patch("shh.services.recording.pyperclip.copy") as mock_clipboard,
+        patch("shh.services.recording.copy_text", return_value=True) as mock_clipboard,
     ):
-        temp_file = tmp_path / "test.wav"
-        mock_save.return_value = temp_file
         mock_transcribe.return_value = WhisperTranscription(
             text="Test transcription", detected_lang="en"
         )
-        mock_clipboard.side_effect = Exception("Clipboard error")
-        temp_file.touch()
-
+        mock_clipboard.return_value = False
         result = await service.transcribe_and_format(audio_data, options)
 
         # Should still succeed but clipboard flag should be False
@@ -197,17 +181,11 @@ async def test_neutral_no_translate_skips_formatting_step(tmp_path: Path) -> Non
     options = RecordingOptions(style=TranscriptionStyle.NEUTRAL)
 
     with (
-        patch("shh.services.recording.save_audio_to_wav") as mock_save,
+        patch("shh.services.recording.save_audio_to_wav_bytes", return_value=b"RIFF"),
         patch("shh.services.recording.transcribe_audio") as mock_transcribe,
-        patch("shh.services.recording.pyperclip.copy"),
+        patch("shh.services.recording.copy_text", return_value=True),
     ):
-        temp_file = tmp_path / "test.wav"
-        mock_save.return_value = temp_file
-        mock_transcribe.return_value = WhisperTranscription(
-            text="Hello world", detected_lang="en"
-        )
-        temp_file.touch()
-
+        mock_transcribe.return_value = WhisperTranscription(text="Hello world", detected_lang="en")
         await service.transcribe_and_format(audio_data, options)
 
     assert "Transcribing" in fake_ui.processing_steps
@@ -225,21 +203,15 @@ async def test_translation_triggers_formatting_step(tmp_path: Path) -> None:
     options = RecordingOptions(style=TranscriptionStyle.NEUTRAL, translate="french")
 
     with (
-        patch("shh.services.recording.save_audio_to_wav") as mock_save,
+        patch("shh.services.recording.save_audio_to_wav_bytes", return_value=b"RIFF"),
         patch("shh.services.recording.transcribe_audio") as mock_transcribe,
         patch("shh.services.recording.format_transcription") as mock_format,
-        patch("shh.services.recording.pyperclip.copy"),
+        patch("shh.services.recording.copy_text", return_value=True),
     ):
-        temp_file = tmp_path / "test.wav"
-        mock_save.return_value = temp_file
-        mock_transcribe.return_value = WhisperTranscription(
-            text="Hello world", detected_lang="en"
-        )
+        mock_transcribe.return_value = WhisperTranscription(text="Hello world", detected_lang="en")
         mock_formatted = MagicMock()
         mock_formatted.text = "Bonjour monde"
         mock_format.return_value = mock_formatted
-        temp_file.touch()
-
         await service.transcribe_and_format(audio_data, options)
 
     assert "Formatting (french)" in fake_ui.processing_steps
@@ -255,17 +227,13 @@ async def test_history_append_on_success(tmp_path: Path) -> None:
     options = RecordingOptions(style=TranscriptionStyle.NEUTRAL)
 
     with (
-        patch("shh.services.recording.save_audio_to_wav") as mock_save,
+        patch("shh.services.recording.save_audio_to_wav_bytes", return_value=b"RIFF"),
         patch("shh.services.recording.transcribe_audio") as mock_transcribe,
-        patch("shh.services.recording.pyperclip.copy"),
+        patch("shh.services.recording.copy_text", return_value=True),
     ):
-        temp_file = tmp_path / "test.wav"
-        mock_save.return_value = temp_file
         mock_transcribe.return_value = WhisperTranscription(
             text="Persisted text", detected_lang="en"
         )
-        temp_file.touch()
-
         await service.transcribe_and_format(audio_data, options)
 
     entries = store.read_all()
@@ -285,17 +253,11 @@ async def test_skip_history_does_not_append(tmp_path: Path) -> None:
     options = RecordingOptions(style=TranscriptionStyle.NEUTRAL)
 
     with (
-        patch("shh.services.recording.save_audio_to_wav") as mock_save,
+        patch("shh.services.recording.save_audio_to_wav_bytes", return_value=b"RIFF"),
         patch("shh.services.recording.transcribe_audio") as mock_transcribe,
-        patch("shh.services.recording.pyperclip.copy"),
+        patch("shh.services.recording.copy_text", return_value=True),
     ):
-        temp_file = tmp_path / "test.wav"
-        mock_save.return_value = temp_file
-        mock_transcribe.return_value = WhisperTranscription(
-            text="No history", detected_lang="en"
-        )
-        temp_file.touch()
-
+        mock_transcribe.return_value = WhisperTranscription(text="No history", detected_lang="en")
         await service.transcribe_and_format(audio_data, options, skip_history=True)
 
     assert store.read_all() == []
@@ -311,17 +273,13 @@ async def test_history_disabled_does_not_append(tmp_path: Path) -> None:
     options = RecordingOptions(style=TranscriptionStyle.NEUTRAL)
 
     with (
-        patch("shh.services.recording.save_audio_to_wav") as mock_save,
+        patch("shh.services.recording.save_audio_to_wav_bytes", return_value=b"RIFF"),
         patch("shh.services.recording.transcribe_audio") as mock_transcribe,
-        patch("shh.services.recording.pyperclip.copy"),
+        patch("shh.services.recording.copy_text", return_value=True),
     ):
-        temp_file = tmp_path / "test.wav"
-        mock_save.return_value = temp_file
         mock_transcribe.return_value = WhisperTranscription(
             text="Disabled history", detected_lang="en"
         )
-        temp_file.touch()
-
         await service.transcribe_and_format(audio_data, options)
 
     assert store.read_all() == []
@@ -358,13 +316,9 @@ async def test_history_append_failure_does_not_break_pipeline(tmp_path: Path) ->
             new_callable=AsyncMock,
             return_value=WhisperTranscription(text="hi", detected_lang="en"),
         ),
-        patch("shh.services.recording.save_audio_to_wav") as mock_save,
-        patch("shh.services.recording.pyperclip.copy"),
+        patch("shh.services.recording.save_audio_to_wav_bytes", return_value=b"RIFF"),
+        patch("shh.services.recording.copy_text", return_value=True),
     ):
-        temp_file = tmp_path / "test.wav"
-        mock_save.return_value = temp_file
-        temp_file.touch()
-
         result = await service.transcribe_and_format(audio, options)
 
     assert result.text == "hi"